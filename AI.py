@@ -38,6 +38,8 @@ class Connect4AI:
             [(1, -1), (-1, 1)]  # Diagonal \
         ]
         """The directions to check for pieces"""
+        self.score_cache = {}
+        """Cache of position scores keyed by the canonical board key"""
 
     def score_pos(self, board: Board) -> int:
         """
@@ -127,6 +129,52 @@ class Connect4AI:
         self.drop_piece(b_copy, col, piece)
         return b_copy.check_connect(col, row, piece)
 
+    @staticmethod
+    def position_key(board: Board) -> tuple:
+        """
+        Method that returns a hashable key of the board data.
+
+        Parameters:
+            board (Board): The current board state
+        """
+
+        return tuple(tuple(column) for column in board.data)
+
+    def canonical_key(self, board: Board) -> tuple:
+        """
+        Method that returns the key shared by the board and its mirror image.
+        The board is left-right symmetric, so both positions score the same.
+
+        Parameters:
+            board (Board): The current board state
+        """
+
+        key = self.position_key(board)
+        return min(key, key[::-1])
+
+    def is_symmetric(self, board: Board) -> bool:
+        """
+        Method that returns whether the board is the same as its mirror image.
+
+        Parameters:
+            board (Board): The current board state
+        """
+
+        key = self.position_key(board)
+        return key == key[::-1]
+
+    @staticmethod
+    def mirror_column(board: Board, col: int) -> int:
+        """
+        Method that returns the column that the given column is reflected to.
+
+        Parameters:
+            board (Board): The current board state
+            col (int): The column to reflect
+        """
+
+        return board.size[0] - 1 - col
+
     @staticmethod
     def get_open_rows(board: Board) -> list:
         """
@@ -206,7 +254,15 @@ class Connect4AI:
 
         # Check if the depth of the search is zero
         if depth == 0:
-            return None, self.score_pos(board)
+            # Mirrored positions share a score, so look them up by the canonical key
+            key = self.canonical_key(board)
+            if key not in self.score_cache:
+                self.score_cache[key] = self.score_pos(board)
+            return None, self.score_cache[key]
+
+        # Mirrored moves in a symmetric position lead to mirrored positions, so only search one side
+        if self.is_symmetric(board):
+            safe_columns = [col for col in safe_columns if col <= self.mirror_column(board, col)]
 
         # Minimax algorithm
         # ----------------------------------------
@@ -272,4 +328,7 @@ class Connect4AI:
         column, _ = self.minimax(self.board, self.depth, -inf, inf, True)
         if column is None:
             column = choice(self.get_valid_locations(self.board))
+        # Only one side of a symmetric board is searched, so pick either side of the mirror
+        elif self.is_symmetric(self.board):
+            column = choice([column, self.mirror_column(self.board, column)])
         return column